@@ -224,29 +224,17 @@ def test(skip_docker: bool = False):
         docker_clean()
         docker_up()
 
-    import subprocess
-    import tempfile
-
     # The SQL script to execute
 
     def run_sql_in_docker(sql):
-        # Write the SQL to a temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as temp_sql_file:
-            temp_sql_file.write(sql)
-            temp_sql_file_path = temp_sql_file.name
-
-        # Command to copy the SQL file into the container
-        copy_cmd = f"docker cp {temp_sql_file_path} brokkr-dev-postgres-1:/tmp/test_script.sql"
-
-        # Command to execute the SQL script in the container
-        exec_cmd = "docker exec brokkr-dev-postgres-1 psql -U brokkr -d brokkr -f /tmp/test_script.sql"
+        # Feed the SQL to psql in the container over stdin; no temp file,
+        # docker cp or shell involved
+        exec_cmd = ["docker", "exec", "-i", "brokkr-dev-postgres-1",
+                    "psql", "-U", "brokkr", "-d", "brokkr"]
 
         try:
-            # Copy the SQL file to the container
-            subprocess.run(copy_cmd, shell=True, check=True)
-
             # Execute the SQL script
-            result = subprocess.run(exec_cmd, shell=True, check=True, capture_output=True, text=True)
+            result = subprocess.run(exec_cmd, input=sql, check=True, capture_output=True, text=True)
 
             # Print the output
             print(result.stdout)
@@ -274,7 +262,11 @@ def test(skip_docker: bool = False):
 
 
 
+    # Apply every migration in one psql session instead of one per file
+    migration_sql = []
     for f in migration_files:
-        run_sql_in_docker(open(f,'r').read())
+        with open(f, 'r') as migration:
+            migration_sql.append(migration.read())
+    run_sql_in_docker("\n".join(migration_sql))
     # Run the SQL script
     run_sql_in_docker(TEST_SQL_SCRIPT)
@@ -27,8 +27,18 @@ def docker_up(services=None, project=DEFAULT_PROJECT):
     )
 
 
+def k3s_ready_sentinel(project=DEFAULT_PROJECT):
+    """Path of the file marking a project's k3s cluster as verified ready."""
+    return os.path.join('/tmp', f'brokkr-k3s-ready-{project}')
+
+
 def docker_down(project=DEFAULT_PROJECT):
     """Stop and remove docker compose services."""
+    # The cluster is going away; later runs must not trust the ready marker.
+    try:
+        os.remove(k3s_ready_sentinel(project))
+    except FileNotFoundError:
+        pass
     subprocess.run(
         f"docker compose -f {DOCKER_COMPOSE_FILE} -p {project} down",
         cwd=cwd,
@@ -44,8 +54,10 @@ def docker_clean(project=DEFAULT_PROJECT):
         f"{project}_brokkr-keys",
         f"{project}_registry-data",
     ]
+    # Volumes that don't exist are expected; discard the errors for them
     subprocess.run(
-        f"docker volume rm {' '.join(volumes)} 2>/dev/null || true",
+        ["docker", "volume", "rm", *volumes],
         cwd=cwd,
-        shell=True
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
     )